@@ -242,8 +242,8 @@ def format_libraries(libraries, settings):
     return result
 
 
-def parallel_compiler_cl_flag(output=None):
-    return "/MP%s" % cpu_count(output=output)
+def parallel_compiler_cl_flag(output=None, jobs=None):
+    return "/MP%s" % (jobs or cpu_count(output=output))
 
 
 def format_frameworks(frameworks, settings):
@@ -50,6 +50,8 @@ class MSBuild(object):
         tools.cpu_count():
         In the solution: Building the solution with the projects in parallel. (/m: parameter).
         CL compiler: Building the sources in parallel. (/MP: compiler flag)
+        An integer N can be given instead of True to use it instead of tools.cpu_count() in both
+        flags (/m:N and /MPN). Each MSBuild process can still run N compiler processes.
         :param force_vcvars: Will ignore if the environment is already set for a different
         Visual Studio version.
         :param toolset: Specify a toolset. Will append a /p:PlatformToolset option.
@@ -173,7 +175,9 @@ class MSBuild(object):
             command.append('/p:Platform="%s"' % msvc_arch)
 
         if parallel:
-            command.append('/m:%s' % cpu_count(output=self._output))
+            if isinstance(parallel, bool):
+                parallel = cpu_count(output=self._output)
+            command.append('/m:%s' % parallel)
 
         if targets:
             command.append("/target:%s" % ";".join(targets))
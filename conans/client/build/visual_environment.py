@@ -69,7 +69,8 @@ class VisualStudioBuildEnvironment(object):
         ret.extend(self.cxx_flags)
 
         if self.parallel:  # Build source in parallel
-            ret.append(parallel_compiler_cl_flag(output=self._conanfile.output))
+            jobs = None if isinstance(self.parallel, bool) else self.parallel
+            ret.append(parallel_compiler_cl_flag(output=self._conanfile.output, jobs=jobs))
 
         if self.std:
             ret.append(self.std)
@@ -1,12 +1,13 @@
+import json
 import os
 import shutil
 from threading import Lock
 
 from six.moves.urllib_parse import urlsplit, urlunsplit
 
-from conans.client.tools.files import check_md5, check_sha1, check_sha256
+from conans.client.tools.files import _check_signature
 from conans.errors import ConanException
-from conans.util.files import mkdir
+from conans.util.files import _generic_algorithm_sum, load, mkdir, save
 from conans.util.locks import SimpleLock
 from conans.util.sha import sha256 as sha256_sum
 
@@ -20,13 +21,53 @@ class CachedFileDownloader(object):
         self._user_download = user_download
 
     @staticmethod
-    def _check_checksum(cache_path, md5, sha1, sha256):
-        if md5:
-            check_md5(cache_path, md5)
-        if sha1:
-            check_sha1(cache_path, sha1)
-        if sha256:
-            check_sha256(cache_path, sha256)
+    def _signatures(md5, sha1, sha256):
+        return [(name, signature) for name, signature in (("md5", md5), ("sha1", sha1),
+                                                          ("sha256", sha256)) if signature]
+
+    def _load_checksums(self, cache_path, h):
+        """ The computed checksums of a cached file are stored in "checksums/<h>", together with
+        the file mtime and size, so they are not computed again while the file doesn't change
+        """
+        stat = os.stat(cache_path)
+        file_id = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        try:
+            checksums = json.loads(load(os.path.join(self._cache_folder, "checksums", h)))
+        except Exception:
+            checksums = {}
+        if checksums.get("file") != file_id:
+            checksums = {"file": file_id}
+        return checksums
+
+    def _save_checksums(self, h, checksums):
+        checksums_path = os.path.join(self._cache_folder, "checksums", h)
+        tmp_path = checksums_path + ".tmp"
+        save(tmp_path, json.dumps(checksums))
+        os.replace(tmp_path, checksums_path)
+
+    def _store_checksum(self, cache_path, h, md5, sha1, sha256):
+        """ The signatures were already verified while downloading, so they are the real ones
+        """
+        signatures = self._signatures(md5, sha1, sha256)
+        if not signatures:
+            return
+        checksums = self._load_checksums(cache_path, h)
+        checksums.update((name, signature.lower()) for name, signature in signatures)
+        self._save_checksums(h, checksums)
+
+    def _check_checksum(self, cache_path, h, md5, sha1, sha256):
+        signatures = self._signatures(md5, sha1, sha256)
+        if not signatures:
+            return
+        checksums = self._load_checksums(cache_path, h)
+        missing = [name for name, _ in signatures if name not in checksums]
+        if missing:
+            for name in missing:
+                checksums[name] = _generic_algorithm_sum(cache_path, name)
+            self._save_checksums(h, checksums)
+
+        for name, signature in signatures:
+            _check_signature(name, cache_path, signature, checksums[name])
 
     def download(self, url, file_path=None, auth=None, retry=None, retry_wait=None, overwrite=False,
                  headers=None, md5=None, sha1=None, sha256=None):
@@ -47,17 +88,18 @@ class CachedFileDownloader(object):
                 if not os.path.exists(cached_path):
                     try:
                         self._file_downloader.download(url, cached_path, auth, retry, retry_wait,
-                                                       overwrite, headers)
-                        self._check_checksum(cached_path, md5, sha1, sha256)
+                                                       overwrite, headers, md5=md5, sha1=sha1,
+                                                       sha256=sha256)
                     except Exception:
                         if os.path.exists(cached_path):
                             os.remove(cached_path)
                         raise
+                    self._store_checksum(cached_path, h, md5, sha1, sha256)
                 else:
                     # specific check for corrupted cached files, will raise, but do nothing more
                     # user can report it or "rm -rf cache_folder/path/to/file"
                     try:
-                        self._check_checksum(cached_path, md5, sha1, sha256)
+                        self._check_checksum(cached_path, h, md5, sha1, sha256)
                     except ConanException as e:
                         raise ConanException("%s\nCached downloaded file corrupted: %s"
                                              % (str(e), cached_path))
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import re
 import time
@@ -6,6 +7,7 @@ import traceback
 import six
 
 from conans.client.rest import response_to_str
+from conans.client.tools.files import _check_signature
 from conans.errors import AuthenticationException, ConanConnectionError, ConanException, \
     NotFoundException, ForbiddenException, RequestErrorException
 from conans.util import progress_bar
@@ -16,14 +18,18 @@ from conans.util.tracer import log_download
 
 class FileDownloader(object):
 
-    def __init__(self, requester, output, verify, config):
+    def __init__(self, requester, output, verify, config, chunk_size=None):
         self._output = output
         self._requester = requester
         self._verify_ssl = verify
         self._config = config
+        self._chunk_size = chunk_size
 
     def download(self, url, file_path=None, auth=None, retry=None, retry_wait=None, overwrite=False,
-                 headers=None):
+                 headers=None, md5=None, sha1=None, sha256=None):
+        """ The checksums, if given, are computed over the downloaded chunks while they are
+        written, so the file doesn't need to be read again to verify it
+        """
         retry = retry if retry is not None else self._config.retry
         retry = retry if retry is not None else 2
         retry_wait = retry_wait if retry_wait is not None else self._config.retry_wait
@@ -41,10 +47,26 @@ class FileDownloader(object):
                 # the dest folder before
                 raise ConanException("Error, the file to download already exists: '%s'" % file_path)
 
-        return _call_with_retry(self._output, retry, retry_wait, self._download_file, url, auth,
-                                headers, file_path)
+        checksums = [(name, signature) for name, signature in (("md5", md5), ("sha1", sha1),
+                                                               ("sha256", sha256)) if signature]
+        if not checksums:
+            return _call_with_retry(self._output, retry, retry_wait, self._download_file, url,
+                                    auth, headers, file_path)
 
-    def _download_file(self, url, auth, headers, file_path, try_resume=False):
+        hashers = {}
+
+        def download_hashing():
+            # Every retry downloads from the beginning, so it needs fresh hashers
+            hashers.clear()
+            hashers.update((name, hashlib.new(name)) for name, _ in checksums)
+            return self._download_file(url, auth, headers, file_path, hashers=hashers)
+
+        ret = _call_with_retry(self._output, retry, retry_wait, download_hashing)
+        for name, signature in checksums:
+            _check_signature(name, file_path or url, signature, hashers[name].hexdigest())
+        return ret
+
+    def _download_file(self, url, auth, headers, file_path, try_resume=False, hashers=None):
         t1 = time.time()
         if try_resume and file_path and os.path.exists(file_path):
             range_start = os.path.getsize(file_path)
@@ -59,22 +81,18 @@ class FileDownloader(object):
         except Exception as exc:
             raise ConanException("Error downloading file %s: '%s'" % (url, exc))
 
-        if not response.ok:
-            if response.status_code == 404:
-                raise NotFoundException("Not found: %s" % url)
-            elif response.status_code == 403:
-                if auth is None or (hasattr(auth, "token") and auth.token is None):
-                    # TODO: This is a bit weird, why this conversion? Need to investigate
-                    raise AuthenticationException(response_to_str(response))
-                raise ForbiddenException(response_to_str(response))
-            elif response.status_code == 401:
-                raise AuthenticationException()
-            raise ConanException("Error %d downloading file %s" % (response.status_code, url))
+        _check_download_response(response, url, auth)
 
         def read_response(size):
             for chunk in response.iter_content(size):
                 yield chunk
 
+        def hash_chunks(chunks):
+            for chunk in chunks:
+                for hasher in hashers.values():
+                    hasher.update(chunk)
+                yield chunk
+
         def write_chunks(chunks, path):
             ret = None
             downloaded_size = range_start
@@ -115,19 +133,20 @@ class FileDownloader(object):
             progress = progress_bar.Progress(total_length, self._output, description)
             progress.initial_value(range_start)
 
-            chunk_size = 1024 if not file_path else 1024 * 100
-            written_chunks, total_downloaded_size = write_chunks(
-                progress.update(read_response(chunk_size)),
-                file_path
-            )
+            chunk_size = self._chunk_size or (1024 if not file_path else 1024 * 100)
+            chunks = progress.update(read_response(chunk_size))
+            if hashers:
+                chunks = hash_chunks(chunks)
+            written_chunks, total_downloaded_size = write_chunks(chunks, file_path)
             gzip = (response.headers.get("content-encoding") == "gzip")
             response.close()
             # it seems that if gzip we don't know the size, cannot resume and shouldn't raise
             if total_downloaded_size != total_length and not gzip:
                 if (file_path and total_length > total_downloaded_size > range_start
                         and response.headers.get("Accept-Ranges") == "bytes"):
+                    # The resumed part is appended, the hashers just keep going with it
                     written_chunks = self._download_file(url, auth, headers, file_path,
-                                                         try_resume=True)
+                                                         try_resume=True, hashers=hashers)
                 else:
                     raise ConanException("Transfer interrupted before complete: %s < %s"
                                          % (total_downloaded_size, total_length))
@@ -144,6 +163,22 @@ class FileDownloader(object):
                                        % str(e))
 
 
+def _check_download_response(response, url, auth):
+    """ raises the exception matching the error status of a download response, if any
+    """
+    if not response.ok:
+        if response.status_code == 404:
+            raise NotFoundException("Not found: %s" % url)
+        elif response.status_code == 403:
+            if auth is None or (hasattr(auth, "token") and auth.token is None):
+                # TODO: This is a bit weird, why this conversion? Need to investigate
+                raise AuthenticationException(response_to_str(response))
+            raise ForbiddenException(response_to_str(response))
+        elif response.status_code == 401:
+            raise AuthenticationException()
+        raise ConanException("Error %d downloading file %s" % (response.status_code, url))
+
+
 def _call_with_retry(out, retry, retry_wait, method, *args, **kwargs):
     for counter in range(retry + 1):
         try:
@@ -13,14 +13,16 @@ from conans.util.runners import check_output_runner
 def pythonpath(conanfile):
     python_path = conanfile.env.get("PYTHONPATH", None)
     if python_path:
-        old_path = sys.path[:]
+        # Entries are only appended, so restoring is truncating back to the original length.
+        # It assumes nobody else modifies the existing sys.path entries inside the block
+        old_len = len(sys.path)
         if isinstance(python_path, list):
             sys.path.extend(python_path)
         else:
             sys.path.append(python_path)
 
         yield
-        sys.path = old_path
+        del sys.path[old_len:]
     else:
         yield
 
@@ -68,15 +70,20 @@ def _environment_add(env_vars, post=False):
         else:
             apply_vars[name] = value
 
-    old_env = dict(os.environ)
-    os.environ.update(apply_vars)
+    # Only the modified variables are saved and restored, not the whole environment
+    old_env = {name: os.environ.get(name) for name in env_vars}
+    for name, value in apply_vars.items():
+        os.environ[name] = value
     for var in unset_vars:
         os.environ.pop(var, None)
     try:
         yield
     finally:
-        os.environ.clear()
-        os.environ.update(old_env)
+        for name, value in old_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
 
 
 @contextmanager
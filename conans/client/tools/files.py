@@ -1,3 +1,4 @@
+import codecs
 import logging
 import os
 import platform
@@ -12,11 +13,15 @@ from conans.client.output import ConanOutput
 from conans.errors import ConanException
 from conans.unicode import get_cwd
 from conans.util.fallbacks import default_output
-from conans.util.files import (_generic_algorithm_sum, load, save)
+from conans.util.files import (_detect_encoding, _generic_algorithm_sum, decode_text, load,
+                               save)
 
 UNIT_SIZE = 1000.0
+_SIZE_SUFFIXES = (('B', 0), ('KB', 1), ('MB', 1), ('GB', 2), ('TB', 2), ('PB', 2))
 # Library extensions supported by collect_libs
 VALID_LIB_EXTENSIONS = (".so", ".lib", ".a", ".dylib", ".bc")
+# Read size of the compressed stream in untargz
+_TAR_BUFFER_SIZE = 1024 * 1024
 
 
 @contextmanager
@@ -35,14 +40,11 @@ def human_size(size_bytes):
     Note that bytes will be reported in whole numbers but KB and above will have
     greater precision.  e.g. 43 B, 443 KB, 4.3 MB, 4.43 GB, etc
     """
-
-    suffixes_table = [('B', 0), ('KB', 1), ('MB', 1), ('GB', 2), ('TB', 2), ('PB', 2)]
-
-    num = float(size_bytes)
-    for suffix, precision in suffixes_table:
-        if num < UNIT_SIZE:
-            break
-        num /= UNIT_SIZE
+    # Every suffix is a factor UNIT_SIZE (1000), so it follows from the number of digits
+    digits = len(str(abs(int(size_bytes))))
+    index = min((digits - 1) // 3, len(_SIZE_SUFFIXES) - 1)
+    suffix, precision = _SIZE_SUFFIXES[index]
+    num = size_bytes / UNIT_SIZE ** index
 
     if precision == 0:
         formatted_size = "%d" % num
@@ -101,11 +103,12 @@ def unzip(filename, destination=".", keep_permissions=False, pattern=None, outpu
             pass
 
     with zipfile.ZipFile(filename, "r") as z:
-        if not pattern:
-            zip_info = z.infolist()
-        else:
-            zip_info = [zi for zi in z.infolist() if fnmatch(zi.filename, pattern)]
-        uncompress_size = sum((file_.file_size for file_ in zip_info))
+        zip_info = z.infolist()
+        if pattern:
+            zip_info = [zi for zi in zip_info if fnmatch(zi.filename, pattern)]
+        uncompress_size = 0
+        for file_ in zip_info:
+            uncompress_size += file_.file_size
         if uncompress_size > 100000:
             output.info("Unzipping %s, this can take a while" % human_size(uncompress_size))
         else:
@@ -126,12 +129,12 @@ def unzip(filename, destination=".", keep_permissions=False, pattern=None, outpu
                 extracted_size += file_.file_size
                 print_progress(extracted_size, uncompress_size)
                 try:
-                    z.extract(file_, full_path)
+                    target_path = z.extract(file_, full_path)
                     if keep_permissions:
                         # Could be dangerous if the ZIP has been created in a non nix system
                         # https://bugs.python.org/issue15795
                         perm = file_.external_attr >> 16 & 0xFFF
-                        os.chmod(os.path.join(full_path, file_.filename), perm)
+                        os.chmod(target_path, perm)
                 except Exception as e:
                     output.error("Error extract %s\n%s" % (file_.filename, str(e)))
         output.writeln("")
@@ -139,17 +142,81 @@ def unzip(filename, destination=".", keep_permissions=False, pattern=None, outpu
 
 def untargz(filename, destination=".", pattern=None):
     import tarfile
-    with tarfile.TarFile.open(filename, 'r:*') as tarredgzippedFile:
-        if not pattern:
-            tarredgzippedFile.extractall(destination)
-        else:
-            members = list(filter(lambda m: fnmatch(m.name, pattern),
-                                  tarredgzippedFile.getmembers()))
-            tarredgzippedFile.extractall(destination, members=members)
+    done = []
+    try:
+        # Streaming mode reads the archive once, without building the index of members first
+        with tarfile.open(filename, 'r|*', bufsize=_TAR_BUFFER_SIZE) as tarredgzippedFile:
+            _untar_members(tarredgzippedFile, destination, pattern, done)
+    except tarfile.StreamError:
+        # A link that cannot be created (e.g. in Windows) is extracted as a copy of its target,
+        # which needs random access to the archive. It resumes after the extracted members,
+        # writing them again would fail for the read-only ones
+        with tarfile.TarFile.open(filename, 'r:*') as tarredgzippedFile:
+            _untar_members(tarredgzippedFile, destination, pattern, done)
+
+
+def _untar_members(tar, destination, pattern=None, done=None):
+    """ extracts the members one by one, so it also works for streamed archives. As
+    TarFile.extractall(), the directories attributes are set at the end, so read-only directories
+    and the extraction of their contents don't interfere
+    :param done: optional list with the names of the members already processed, in archive
+    order. Those are skipped, so an interrupted extraction can be resumed from the same archive,
+    and the newly processed members are appended
+    """
+    import tarfile
+    done = done if done is not None else []
+    resume_index = len(done)
+    directories = []
+    for index, member in enumerate(tar):
+        if pattern and not fnmatch(member.name, pattern):
+            if index >= resume_index:
+                done.append(member.name)
+            continue
+        if member.isdir():
+            directories.append(member)
+        if index >= resume_index:
+            tar.extract(member, destination, set_attrs=not member.isdir())
+            done.append(member.name)
+
+    directories.sort(key=lambda m: m.name, reverse=True)
+    for member in directories:
+        dir_path = os.path.join(destination, member.name)
+        try:
+            tar.chown(member, dir_path, False)
+            tar.utime(member, dir_path)
+            tar.chmod(member, dir_path)
+        except tarfile.ExtractError:
+            pass
 
 
 def check_with_algorithm_sum(algorithm_name, file_path, signature):
     real_signature = _generic_algorithm_sum(file_path, algorithm_name)
+    _check_signature(algorithm_name, file_path, signature, real_signature)
+
+
+def check_with_algorithm_sums(algorithm_name, file_signatures, output=None):
+    """ Checks several files concurrently
+    :param algorithm_name: hash algorithm, e.g. "sha256"
+    :param file_signatures: iterable of (file_path, signature) pairs
+    :param output: output to warn if the number of cpus cannot be detected
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from conans.client.tools.oss import cpu_count
+
+    file_signatures = list(file_signatures)
+    if not file_signatures:
+        return
+    # hashlib releases the GIL while hashing big buffers, so threads are enough
+    output = default_output(output, 'conans.client.tools.files.check_with_algorithm_sums')
+    workers = max(1, min(len(file_signatures), cpu_count(output=output)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        real_signatures = list(executor.map(lambda f: _generic_algorithm_sum(f, algorithm_name),
+                                            [file_path for file_path, _ in file_signatures]))
+    for (file_path, signature), real_signature in zip(file_signatures, real_signatures):
+        _check_signature(algorithm_name, file_path, signature, real_signature)
+
+
+def _check_signature(algorithm_name, file_path, signature, real_signature):
     if real_signature != signature.lower():
         raise ConanException("%s signature failed for '%s' file. \n"
                              " Provided signature: %s  \n"
@@ -184,7 +251,9 @@ def patch(base_path=None, patch_file=None, patch_string=None, strip=0, output=No
 
     class PatchLogHandler(logging.Handler):
         def __init__(self):
-            logging.Handler.__init__(self, logging.DEBUG)
+            # patch_ng DEBUG records are too verbose (many per hunk), they are not displayed
+            logging.Handler.__init__(self, logging.INFO)
+            self.setFormatter(logging.Formatter("%(message)s"))
             self.output = output or ConanOutput(sys.stdout, sys.stderr, color=True)
             self.patchname = patch_file if patch_file else "patch_ng"
 
@@ -228,7 +297,21 @@ def replace_in_file(file_path, search, replace, strict=True, output=None, encodi
 
     encoding_in = encoding or "auto"
     encoding_out = encoding or "utf-8"
-    content = load(file_path, encoding=encoding_in)
+    raw_content = load(file_path, binary=True)
+    # An empty search matches between characters, not bytes, so it needs the decoded text
+    if search and _is_utf8(raw_content, encoding_in):
+        # UTF-8 in and out: replace the bytes directly, no need to decode and encode back
+        if encoding_in != "auto":
+            # The auto detection already checked it, invalid content raises UnicodeDecodeError
+            raw_content.decode(encoding_in)
+        search_bytes = search.encode("utf-8")
+        if -1 == raw_content.find(search_bytes):
+            _manage_text_not_found(search, file_path, strict, "replace_in_file", output=output)
+        content = raw_content.replace(search_bytes, replace.encode("utf-8"))
+        save(file_path, content, only_if_modified=False)
+        return
+
+    content = decode_text(raw_content, encoding=encoding_in)
     if -1 == content.find(search):
         _manage_text_not_found(search, file_path, strict, "replace_in_file", output=output)
     content = content.replace(search, replace)
@@ -236,6 +319,14 @@ def replace_in_file(file_path, search, replace, strict=True, output=None, encodi
     save(file_path, content, only_if_modified=False, encoding=encoding_out)
 
 
+def _is_utf8(content, encoding):
+    """ True if the bytes content is (or will be decoded as) UTF-8 without BOM stripping
+    """
+    if encoding == "auto":
+        encoding, _ = _detect_encoding(content)
+    return encoding is not None and codecs.lookup(encoding).name == "utf-8"
+
+
 def replace_path_in_file(file_path, search, replace, strict=True, windows_paths=None, output=None,
                          encoding=None):
     output = default_output(output, 'conans.client.tools.files.replace_path_in_file')
@@ -1,11 +1,18 @@
 import os
+import tarfile
 
 from conans.client.rest.download_cache import CachedFileDownloader
-from conans.client.rest.file_downloader import FileDownloader
-from conans.client.tools.files import check_md5, check_sha1, check_sha256, unzip
-from conans.errors import ConanException
+from conans.client.rest.file_downloader import (FileDownloader, _call_with_retry,
+                                                 _check_download_response)
+from conans.client.tools.files import _untar_members, unzip
+from conans.errors import ConanConnectionError, ConanException
 from conans.util.fallbacks import default_output, default_requester
 
+# Tarballs that get() can extract directly from the download stream
+_STREAMABLE_TAR_EXTENSIONS = (".tar.gz", ".tgz", ".tbz2", ".tar.bz2", ".tar", ".tar.xz", ".txz")
+# User downloads are usually big archives, read them from the response in large chunks
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def get(url, md5='', sha1='', sha256='', destination=".", filename="", keep_permissions=False,
         pattern=None, requester=None, output=None, verify=True, retry=None, retry_wait=None,
@@ -20,6 +27,14 @@ def get(url, md5='', sha1='', sha256='', destination=".", filename="", keep_perm
                                  "parameter.".format(url_base))
         filename = os.path.basename(url_base)
 
+    if (not (md5 or sha1 or sha256) and not isinstance(url, (list, tuple)) and
+            filename.endswith(_STREAMABLE_TAR_EXTENSIONS) and not os.path.exists(filename)):
+        # Nothing to verify before extracting: untar while downloading, without a temporary file
+        return _get_tar_streamed(url, filename, destination=destination, pattern=pattern,
+                                 requester=requester, output=output, verify=verify, retry=retry,
+                                 retry_wait=retry_wait, overwrite=overwrite, auth=auth,
+                                 headers=headers)
+
     download(url, filename, out=output, requester=requester, verify=verify, retry=retry,
              retry_wait=retry_wait, overwrite=overwrite, auth=auth, headers=headers,
              md5=md5, sha1=sha1, sha256=sha256)
@@ -28,6 +43,91 @@ def get(url, md5='', sha1='', sha256='', destination=".", filename="", keep_perm
     os.unlink(filename)
 
 
+def _get_tar_streamed(url, filename, destination, pattern, requester, output, verify, retry,
+                      retry_wait, overwrite, auth, headers):
+    """ downloads a tarball and extracts it on the fly from the HTTP response stream. There is no
+    download progress bar, as the size of the extracted contents is not the downloaded one
+    """
+    output = default_output(output, 'conans.client.tools.net.get')
+    requester = default_requester(requester, 'conans.client.tools.net.get')
+    from conans.tools import _global_config as config
+
+    retry = retry if retry is not None else config.retry
+    retry = retry if retry is not None else 1
+    retry_wait = retry_wait if retry_wait is not None else config.retry_wait
+    retry_wait = retry_wait if retry_wait is not None else 5
+
+    # Shared by the retries and the fallback, they resume after the already extracted members
+    done = []
+
+    def _download_and_untar():
+        try:
+            response = requester.get(url, stream=True, verify=verify, auth=auth, headers=headers)
+        except Exception as exc:
+            raise ConanException("Error downloading file %s: '%s'" % (url, exc))
+        try:
+            _check_download_response(response, url, auth)
+            response.raw.decode_content = True
+            stream = _CountingReader(response.raw)
+            try:
+                with tarfile.open(fileobj=stream, mode="r|*") as tar:
+                    _untar_members(tar, destination, pattern, done)
+            except tarfile.ReadError:
+                # A connection dropped in the middle of a member looks like a broken archive
+                _check_transfer_complete(response, stream)
+                raise
+            # tarfile stops quietly if the stream ends at a member boundary
+            _check_transfer_complete(response, stream)
+        except (ConanException, tarfile.TarError):
+            raise
+        except Exception as exc:
+            # Connection problems surface here while reading the stream, they can be retried
+            raise ConanConnectionError("Download failed, check server, possibly try again\n%s"
+                                       % str(exc))
+        finally:
+            response.close()
+
+    output.info("Downloading and extracting %s" % filename)
+    try:
+        _call_with_retry(output, retry, retry_wait, _download_and_untar)
+    except tarfile.StreamError:
+        # A link that cannot be created (e.g. in Windows) is extracted as a copy of its target,
+        # which needs random access to the archive, so it has to be downloaded
+        download(url, filename, out=output, requester=requester, verify=verify, retry=retry,
+                 retry_wait=retry_wait, overwrite=overwrite, auth=auth, headers=headers)
+        with tarfile.open(filename, "r:*") as tar:
+            _untar_members(tar, destination, pattern, done)
+        os.unlink(filename)
+
+
+class _CountingReader(object):
+    """ file-like wrapper of the response stream that counts the bytes read
+    """
+    def __init__(self, raw):
+        self._raw = raw
+        self.read_size = 0
+
+    def read(self, size=-1):
+        data = self._raw.read(size)
+        self.read_size += len(data)
+        return data
+
+
+def _check_transfer_complete(response, stream):
+    """ reads what is left of the stream (e.g. the end of archive padding) and raises a retryable
+    error if less than the Content-Length was received
+    """
+    while stream.read(_DOWNLOAD_CHUNK_SIZE):
+        pass
+    total_length = response.headers.get("Content-Length")
+    # The length of encoded (e.g. gzip) contents is not the length of the decoded stream
+    if total_length is None or response.headers.get("Content-Encoding"):
+        return
+    if stream.read_size < int(total_length):
+        raise ConanConnectionError("Transfer interrupted before complete: %s < %s"
+                                   % (stream.read_size, total_length))
+
+
 def ftp_download(ip, filename, login='', password=''):
     import ftplib
     try:
@@ -89,25 +189,16 @@ def download(url, filename, verify=True, out=None, retry=None, retry_wait=None,
 
     checksum = sha256 or sha1 or md5
 
-    downloader = FileDownloader(requester=requester, output=out, verify=verify, config=config)
+    downloader = FileDownloader(requester=requester, output=out, verify=verify, config=config,
+                                chunk_size=_DOWNLOAD_CHUNK_SIZE)
+    # The download cache is only used if a checksum is provided, otherwise, a normal download
     if config and config.download_cache and checksum:
         downloader = CachedFileDownloader(config.download_cache, downloader, user_download=True)
 
     def _download_file(file_url):
-        # The download cache is only used if a checksum is provided, otherwise, a normal download
-        if isinstance(downloader, CachedFileDownloader):
-            downloader.download(file_url, filename, retry=retry, retry_wait=retry_wait,
-                                overwrite=overwrite, auth=auth, headers=headers, md5=md5,
-                                sha1=sha1, sha256=sha256)
-        else:
-            downloader.download(file_url, filename, retry=retry, retry_wait=retry_wait,
-                                overwrite=overwrite, auth=auth, headers=headers)
-            if md5:
-                check_md5(filename, md5)
-            if sha1:
-                check_sha1(filename, sha1)
-            if sha256:
-                check_sha256(filename, sha256)
+        downloader.download(file_url, filename, retry=retry, retry_wait=retry_wait,
+                            overwrite=overwrite, auth=auth, headers=headers, md5=md5, sha1=sha1,
+                            sha256=sha256)
         out.writeln("")
 
     if not isinstance(url, (list, tuple)):
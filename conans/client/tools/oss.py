@@ -6,6 +6,7 @@ import subprocess
 import sys
 import warnings
 from collections import namedtuple
+from functools import lru_cache
 
 from conans.client.tools.env import environment_append
 from conans.client.tools.files import load, which
@@ -39,7 +40,11 @@ class CpuProperties(object):
                 return int(math.ceil(cfs_quota_us / cfs_period_us))
         except:
             pass
-        return multiprocessing.cpu_count()
+        try:
+            # Honors the CPU affinity mask (taskset, cpusets, schedulers like SLURM)
+            return len(os.sched_getaffinity(0))
+        except AttributeError:  # Only available in some Unix platforms
+            return multiprocessing.cpu_count()
 
 
 def cpu_count(output=None):
@@ -58,11 +63,19 @@ def cpu_count(output=None):
 
 
 def detected_os():
-    if OSInfo().is_macos:
+    system = platform.system()
+    if system == "Darwin":
         return "Macos"
-    if OSInfo().is_windows:
+    if _is_windows_system(system):
         return "Windows"
-    return platform.system()
+    return system
+
+
+def _is_windows_system(system):
+    """ True for Windows and its MSYS/MinGW and Cygwin shells, checking it doesn't need to build
+    a whole OSInfo (which detects the OS version)
+    """
+    return system == "Windows" or system.startswith(("MING", "MSYS_NT", "CYGWIN_NT"))
 
 
 def detected_architecture():
@@ -114,6 +127,37 @@ def detected_architecture():
 
 # DETECT OS, VERSION AND DISTRIBUTIONS
 
+# OS version names, indexed by Version.major() ("8.Y.Z") or Version.minor() ("3.1.Z") values
+_DEBIAN_VERSION_NAMES = {"8.Y.Z": "jessie",
+                         "7.Y.Z": "wheezy",
+                         "6.Y.Z": "squeeze",
+                         "5.Y.Z": "lenny",
+                         "4.Y.Z": "etch",
+                         "3.1.Z": "sarge",
+                         "3.0.Z": "woody"}
+
+_WIN_VERSION_NAMES = {"5.Y.Z": "Windows XP",
+                      "6.0.Z": "Windows Vista",
+                      "6.1.Z": "Windows 7",
+                      "6.2.Z": "Windows 8",
+                      "6.3.Z": "Windows 8.1",
+                      "10.0.Z": "Windows 10"}
+
+_OSX_VERSION_NAMES = {"10.13.Z": "High Sierra",
+                      "10.12.Z": "Sierra",
+                      "10.11.Z": "El Capitan",
+                      "10.10.Z": "Yosemite",
+                      "10.9.Z": "Mavericks",
+                      "10.8.Z": "Mountain Lion",
+                      "10.7.Z": "Lion",
+                      "10.6.Z": "Snow Leopard",
+                      "10.5.Z": "Leopard",
+                      "10.4.Z": "Tiger",
+                      "10.3.Z": "Panther",
+                      "10.2.Z": "Jaguar",
+                      "10.1.Z": "Puma",
+                      "10.0.Z": "Cheetha"}
+
 
 class OSInfo(object):
     """ Usage:
@@ -142,7 +186,7 @@ class OSInfo(object):
         self.linux_distro = None
         self.is_msys = system.startswith("MING") or system.startswith("MSYS_NT")
         self.is_cygwin = system.startswith("CYGWIN_NT")
-        self.is_windows = system == "Windows" or self.is_msys or self.is_cygwin
+        self.is_windows = _is_windows_system(system)
         self.is_macos = system == "Darwin"
         self.is_freebsd = system == "FreeBSD"
         self.is_solaris = system == "SunOS"
@@ -256,70 +300,20 @@ class OSInfo(object):
     def get_debian_version_name(version):
         if not version:
             return None
-        elif version.major() == "8.Y.Z":
-            return "jessie"
-        elif version.major() == "7.Y.Z":
-            return "wheezy"
-        elif version.major() == "6.Y.Z":
-            return "squeeze"
-        elif version.major() == "5.Y.Z":
-            return "lenny"
-        elif version.major() == "4.Y.Z":
-            return "etch"
-        elif version.minor() == "3.1.Z":
-            return "sarge"
-        elif version.minor() == "3.0.Z":
-            return "woody"
+        return _DEBIAN_VERSION_NAMES.get(version.major()) or \
+            _DEBIAN_VERSION_NAMES.get(version.minor())
 
     @staticmethod
     def get_win_version_name(version):
         if not version:
             return None
-        elif version.major() == "5.Y.Z":
-            return "Windows XP"
-        elif version.minor() == "6.0.Z":
-            return "Windows Vista"
-        elif version.minor() == "6.1.Z":
-            return "Windows 7"
-        elif version.minor() == "6.2.Z":
-            return "Windows 8"
-        elif version.minor() == "6.3.Z":
-            return "Windows 8.1"
-        elif version.minor() == "10.0.Z":
-            return "Windows 10"
+        return _WIN_VERSION_NAMES.get(version.major()) or _WIN_VERSION_NAMES.get(version.minor())
 
     @staticmethod
     def get_osx_version_name(version):
         if not version:
             return None
-        elif version.minor() == "10.13.Z":
-            return "High Sierra"
-        elif version.minor() == "10.12.Z":
-            return "Sierra"
-        elif version.minor() == "10.11.Z":
-            return "El Capitan"
-        elif version.minor() == "10.10.Z":
-            return "Yosemite"
-        elif version.minor() == "10.9.Z":
-            return "Mavericks"
-        elif version.minor() == "10.8.Z":
-            return "Mountain Lion"
-        elif version.minor() == "10.7.Z":
-            return "Lion"
-        elif version.minor() == "10.6.Z":
-            return "Snow Leopard"
-        elif version.minor() == "10.5.Z":
-            return "Leopard"
-        elif version.minor() == "10.4.Z":
-            return "Tiger"
-        elif version.minor() == "10.3.Z":
-            return "Panther"
-        elif version.minor() == "10.2.Z":
-            return "Jaguar"
-        elif version.minor() == "10.1.Z":
-            return "Puma"
-        elif version.minor() == "10.0.Z":
-            return "Cheetha"
+        return _OSX_VERSION_NAMES.get(version.minor())
 
     @staticmethod
     def get_aix_architecture():
@@ -372,7 +366,7 @@ class OSInfo(object):
     @staticmethod
     def uname(options=None):
         options = " %s" % options if options else ""
-        if not OSInfo().is_windows:
+        if not _is_windows_system(platform.system()):
             raise ConanException("Command only for Windows operating system")
         custom_bash_path = OSInfo.bash_path()
         if not custom_bash_path:
@@ -390,7 +384,7 @@ class OSInfo(object):
     @staticmethod
     def get_aix_conf(options=None):
         options = " %s" % options if options else ""
-        if not OSInfo().is_aix:
+        if platform.system() != "AIX":
             raise ConanException("Command only for AIX operating system")
 
         try:
@@ -402,7 +396,7 @@ class OSInfo(object):
     @staticmethod
     def detect_windows_subsystem():
         from conans.client.tools.win import CYGWIN, MSYS2, MSYS, WSL
-        if OSInfo().is_linux:
+        if platform.system() == "Linux":
             try:
                 # https://github.com/Microsoft/WSL/issues/423#issuecomment-221627364
                 with open("/proc/sys/kernel/osrelease") as f:
@@ -432,6 +426,13 @@ class OSInfo(object):
             return None
 
 
+@lru_cache(maxsize=1)
+def get_os_info():
+    """ OSInfo of the running system, detected only once as it cannot change
+    """
+    return OSInfo()
+
+
 def cross_building(conanfile=None, self_os=None, self_arch=None, skip_x64_x86=False, settings=None):
     # Handle input arguments (backwards compatibility with 'settings' as first argument)
     # TODO: This can be promoted to a decorator pattern for tools if we adopt 'conanfile' as the
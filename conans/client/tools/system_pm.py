@@ -1,8 +1,10 @@
 import os
 import sys
 
+from six import StringIO
+
 from conans.client.runner import ConanRunner
-from conans.client.tools.oss import OSInfo, cross_building, get_cross_building_settings
+from conans.client.tools.oss import cross_building, get_cross_building_settings, get_os_info
 from conans.client.tools.files import which
 from conans.errors import ConanException
 from conans.util.env_reader import get_env
@@ -15,9 +17,8 @@ class SystemPackageTool(object):
                  conanfile=None, default_mode="enabled"):
         output = output if output else conanfile.output if conanfile else None
         self._output = default_output(output, 'conans.client.tools.system_pm.SystemPackageTool')
-        os_info = os_info or OSInfo()
         self._is_up_to_date = False
-        self._tool = tool or self._create_tool(os_info, output=self._output)
+        self._tool = tool or self._create_tool(os_info or get_os_info(), output=self._output)
         self._tool._sudo_str = self._get_sudo_str()
         self._tool._runner = runner or ConanRunner(output=self._output)
         self._tool._recommends = recommends
@@ -151,6 +152,16 @@ class SystemPackageTool(object):
         if not packages:
             return True
 
+        if len(packages) > 1 and hasattr(self._tool, "installed_bulk"):
+            # A single call to the package manager instead of one per package
+            names = set(name for pkg in packages for name in pkg.split())
+            installed = self._tool.installed_bulk(sorted(names))
+            for pkg in packages:
+                if all(name in installed for name in pkg.split()):
+                    self._output.info("Package already installed: %s" % pkg)
+                    return True
+            return False
+
         for pkg in packages:
             if self._tool.installed(pkg):
                 self._output.info("Package already installed: %s" % pkg)
@@ -220,6 +231,31 @@ class AptTool(BaseTool):
                                  % package_name, None)
         return exit_code == 0
 
+    def installed_bulk(self, package_names):
+        """ returns the subset of package_names that are installed. Names are matched against the
+        ${binary:Package} reported by dpkg, where a native package might have no ':arch' suffix
+        """
+        output = StringIO()
+        self._runner("dpkg-query -W -f='${binary:Package} ${Status}\\n' %s"
+                     % " ".join(package_names), output)
+        reported = set()
+        for line in output.getvalue().splitlines():
+            tokens = line.split(" ", 1)
+            if len(tokens) == 2 and tokens[1].endswith("ok installed"):
+                reported.add(tokens[0])
+        if not any(":" in name for name in reported.union(package_names)):
+            return reported.intersection(package_names)
+
+        arch_output = StringIO()
+        self._runner("dpkg --print-architecture", arch_output)
+        native_arch = arch_output.getvalue().strip()
+
+        def qualified(name):
+            return name if ":" in name else "%s:%s" % (name, native_arch)
+
+        installed = set(qualified(name) for name in reported)
+        return set(name for name in package_names if qualified(name) in installed)
+
     def get_package_name(self, package, arch, arch_names):
         if arch_names is None:
             arch_names = {"x86_64": "amd64",
@@ -251,6 +287,9 @@ class YumTool(BaseTool):
         exit_code = self._runner("rpm -q %s" % package_name, None)
         return exit_code == 0
 
+    def installed_bulk(self, package_names):
+        return _rpm_installed_bulk(self._runner, package_names)
+
     def get_package_name(self, package, arch, arch_names):
         if arch_names is None:
             arch_names = {"x86_64": "x86_64",
@@ -293,6 +332,14 @@ class BrewTool(BaseTool):
         exit_code = self._runner('test -n "$(brew ls --versions %s)"' % package_name, None)
         return exit_code == 0
 
+    def installed_bulk(self, package_names):
+        output = StringIO()
+        self._runner("brew ls --versions %s" % " ".join(package_names), output)
+        # Only installed formulas are listed, as "<name> <version> [<version>...]"
+        installed = set(line.split()[0] for line in output.getvalue().splitlines()
+                        if line.strip())
+        return set(name for name in package_names if name.split("/")[-1] in installed)
+
 
 class PkgTool(BaseTool):
     def add_repository(self, repository, repo_key=None):
@@ -380,6 +427,9 @@ class ZypperTool(BaseTool):
         exit_code = self._runner("rpm -q %s" % package_name, None)
         return exit_code == 0
 
+    def installed_bulk(self, package_names):
+        return _rpm_installed_bulk(self._runner, package_names)
+
     def get_package_name(self, package, arch, arch_names):
         if arch_names is None:
             arch_names = {"x86": "i586"}
@@ -388,6 +438,22 @@ class ZypperTool(BaseTool):
         return package
 
 
+def _rpm_installed_bulk(runner, package_names):
+    """ returns the subset of package_names that are installed, queried with a single 'rpm -q'
+    """
+    output = StringIO()
+    exit_code = runner("rpm -q %s" % " ".join(package_names), output)
+    # rpm prints "package <name> is not installed" for each missing one, and returns their count
+    not_installed = set()
+    for line in output.getvalue().splitlines():
+        line = line.strip()
+        if line.startswith("package ") and line.endswith(" is not installed"):
+            not_installed.add(line[len("package "):-len(" is not installed")])
+    if exit_code != len(not_installed):  # Unexpected output, assume nothing is installed
+        return set()
+    return set(name for name in package_names if name not in not_installed)
+
+
 def _run(runner, command, output, accepted_returns=None):
     accepted_returns = accepted_returns or [0, ]
     output.info("Running: %s" % command)
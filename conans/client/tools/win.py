@@ -9,7 +9,8 @@ from contextlib import contextmanager
 
 from conans.client.tools import which
 from conans.client.tools.env import environment_append
-from conans.client.tools.oss import OSInfo, detected_architecture, get_build_os_arch
+from conans.client.tools.oss import (OSInfo, _is_windows_system, detected_architecture,
+                                     get_build_os_arch)
 from conans.errors import ConanException
 from conans.model.version import Version
 from conans.unicode import get_cwd
@@ -605,7 +606,7 @@ def unix_path(path, path_flavor=None):
     if not path:
         return None
 
-    if not OSInfo().is_windows:
+    if not _is_windows_system(platform.system()):
         return path
 
     if os.path.exists(path):
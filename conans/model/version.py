@@ -28,12 +28,25 @@ class Version(str):
                 self._cached_list.append(int(item) if item.isdigit() else item)
         return self._cached_list
 
+    def _cached(self, name, fill, compute):
+        # Versions are immutable, so the derived major/minor versions are computed only once
+        if not hasattr(self, "_cached_derived"):
+            self._cached_derived = {}
+        key = (name, bool(fill))
+        ret = self._cached_derived.get(key)
+        if ret is None:
+            ret = self._cached_derived[key] = compute(fill)
+        return ret
+
     def major(self, fill=True):
         """
         Get the major item from the version string
         :param fill: Fill full version format with major.Y.Z
         :return: version class
         """
+        return self._cached("major", fill, self._major)
+
+    def _major(self, fill):
         self_list = self.as_list
         if not isinstance(self_list[0], int):
             return self._base
@@ -58,6 +71,9 @@ class Version(str):
         :param fill: Fill full version format with major.minor.Z
         :return: version class
         """
+        return self._cached("minor", fill, self._minor)
+
+    def _minor(self, fill):
         self_list = self.as_list
         if not isinstance(self_list[0], int):
             return self._base
@@ -56,6 +56,8 @@ class VisualStudioBuildEnvironmentTest(unittest.TestCase):
             "UseEnv": "True",
             "_LINK_": ['-myexelinkflag', '-mysharedlinkflag', 'gdi32.lib', 'user32.lib']
         })
+        tool.parallel = 3
+        self.assertEqual(tool.vars_dict["CL"][-1], '/MP3')
         tool.parallel = False
 
         # Now alter the paths before the vars_dict call
@@ -35,8 +35,10 @@ class DetectedOSTest(unittest.TestCase):
 
     def test_linux(self):
         with mock.patch("platform.system", mock.MagicMock(return_value='Linux')):
-            with mock.patch.object(OSInfo, '_get_linux_distro_info'):
+            with mock.patch.object(OSInfo, '_get_linux_distro_info') as distro_mock:
                 self.assertEqual(detected_os(), "Linux")
+                # The OS name doesn't need the distro detection
+                self.assertFalse(distro_mock.called)
 
     def test_freebsd(self):
         with mock.patch("platform.system", mock.MagicMock(return_value='FreeBSD')):
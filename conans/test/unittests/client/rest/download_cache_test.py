@@ -0,0 +1,58 @@
+import os
+import unittest
+
+import mock
+import six
+
+from conans.client.rest.download_cache import CachedFileDownloader
+from conans.errors import ConanException
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, md5, save
+
+
+class _FileDownloaderMock(object):
+    def __init__(self, content):
+        self.content = content
+        self.downloads = 0
+
+    def download(self, url, file_path, *args, **kwargs):
+        self.downloads += 1
+        save(file_path, self.content)
+
+
+class CachedFileDownloaderTest(unittest.TestCase):
+
+    def test_cached_checksums(self):
+        cache_folder = temp_folder()
+        file_downloader = _FileDownloaderMock("some content")
+        downloader = CachedFileDownloader(cache_folder, file_downloader, user_download=True)
+        signature = md5("some content")
+        target = os.path.join(temp_folder(), "myfile.txt")
+
+        downloader.download("http://myurl/myfile.txt", target, md5=signature)
+        self.assertEqual(1, file_downloader.downloads)
+        with mock.patch("conans.client.rest.download_cache._generic_algorithm_sum",
+                        return_value=signature) as sum_mock:
+            downloader.download("http://myurl/myfile.txt", target, overwrite=True, md5=signature)
+            downloader.download("http://myurl/myfile.txt", target, overwrite=True, md5=signature)
+            # The checksum computed while downloading is reused by the cache hits
+            self.assertEqual(0, sum_mock.call_count)
+        self.assertEqual(1, file_downloader.downloads)
+        self.assertEqual("some content", load(target))
+
+        # A modified cached file is checked again
+        cached_file = [f for f in os.listdir(cache_folder)
+                       if os.path.isfile(os.path.join(cache_folder, f))][0]
+        save(os.path.join(cache_folder, cached_file), "some other content")
+        with six.assertRaisesRegex(self, ConanException, "Cached downloaded file corrupted"):
+            downloader.download("http://myurl/myfile.txt", target, overwrite=True, md5=signature)
+
+    def test_no_checksums(self):
+        cache_folder = temp_folder()
+        file_downloader = _FileDownloaderMock("some content")
+        downloader = CachedFileDownloader(cache_folder, file_downloader)
+
+        downloader.download("http://myurl/myfile.txt")
+        self.assertEqual(b"some content", downloader.download("http://myurl/myfile.txt"))
+        self.assertEqual(1, file_downloader.downloads)
+        self.assertFalse(os.path.exists(os.path.join(cache_folder, "checksums")))
@@ -1,3 +1,4 @@
+import hashlib
 import re
 import tempfile
 import unittest
@@ -21,8 +22,10 @@ class MockResponse(object):
         self.status_code = status_code
         self.headers = headers.copy()
         self.headers.update({key.lower(): value for key, value in headers.items()})
+        self.chunk_sizes = []
 
     def iter_content(self, size):
+        self.chunk_sizes.append(size)
         for i in range(0, len(self.data), size):
             yield self.data[i:i + size]
 
@@ -39,6 +42,7 @@ class MockRequester(object):
         self._chunk_size = chunk_size if chunk_size is not None else len(data)
         self._accept_ranges = accept_ranges
         self._echo_header = echo_header.copy() if echo_header else {}
+        self.responses = []
 
     def get(self, *_args, **kwargs):
         start = 0
@@ -62,6 +66,7 @@ class MockRequester(object):
             headers.update(self._echo_header)
         response = MockResponse(self._data[start:start + self._chunk_size], status_code=status,
                                 headers=headers)
+        self.responses.append(response)
         return response
 
 
@@ -139,3 +144,38 @@ class DownloaderUnitTest(unittest.TestCase):
         downloader.download("fake_url", file_path=self.target)
         actual_content = load(self.target, binary=True)
         self.assertEqual(expected_content, actual_content)
+
+    def test_download_chunk_size(self):
+        expected_content = b"some data"
+        requester = MockRequester(expected_content)
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config=_ConfigMock())
+        downloader.download("fake_url", file_path=self.target)
+        self.assertEqual([1024 * 100], requester.responses[0].chunk_sizes)
+
+        target = tempfile.mktemp()
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config=_ConfigMock(), chunk_size=1024 * 1024)
+        downloader.download("fake_url", file_path=target)
+        self.assertEqual([1024 * 1024], requester.responses[1].chunk_sizes)
+        self.assertEqual(expected_content, load(target, binary=True))
+
+    def test_download_checksums(self):
+        expected_content = b"some data"
+        sha256 = hashlib.sha256(expected_content).hexdigest()
+        md5 = hashlib.md5(expected_content).hexdigest()
+        # Resumed downloads keep hashing the appended chunks
+        requester = MockRequester(expected_content, chunk_size=4)
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config=_ConfigMock())
+        downloader.download("fake_url", file_path=self.target, md5=md5, sha256=sha256)
+        self.assertEqual(expected_content, load(self.target, binary=True))
+
+        downloader = FileDownloader(requester=MockRequester(expected_content), output=self.out,
+                                    verify=None, config=_ConfigMock())
+        contents = downloader.download("fake_url", sha256=sha256)
+        self.assertEqual(expected_content, contents)
+
+        target = tempfile.mktemp()
+        with self.assertRaisesRegexp(ConanException, "sha256 signature failed"):
+            downloader.download("fake_url", file_path=target, sha256="1234")
@@ -5,8 +5,9 @@ import mock
 import unittest
 
 from conans.client.tools import OSInfo, environment_append, CYGWIN, MSYS2, MSYS, WSL, \
-    remove_from_path
+    remove_from_path, get_os_info
 from conans.errors import ConanException
+from conans.model.version import Version
 
 
 class OSInfoTest(unittest.TestCase):
@@ -239,3 +240,18 @@ class OSInfoTest(unittest.TestCase):
             with self.assertRaises(ConanException):
                 OSInfo.uname()
             self.assertIsNone(OSInfo.detect_windows_subsystem())
+
+    def test_get_os_info_cached(self):
+        os_info = get_os_info()
+        self.assertIsInstance(os_info, OSInfo)
+        with mock.patch("platform.system", mock.MagicMock(return_value='Windows')):
+            self.assertIs(get_os_info(), os_info)
+
+    def test_version_names(self):
+        self.assertEqual(OSInfo.get_osx_version_name(Version("10.12.6")), "Sierra")
+        self.assertIsNone(OSInfo.get_osx_version_name(Version("9.1")))
+        self.assertEqual(OSInfo.get_win_version_name(Version("5.1")), "Windows XP")
+        self.assertEqual(OSInfo.get_win_version_name(Version("6.3")), "Windows 8.1")
+        self.assertEqual(OSInfo.get_debian_version_name(Version("8.11")), "jessie")
+        self.assertEqual(OSInfo.get_debian_version_name(Version("3.1")), "sarge")
+        self.assertIsNone(OSInfo.get_debian_version_name(None))
@@ -8,7 +8,8 @@ from conans import tools
 from conans.client.output import ConanOutput
 from conans.client.tools.files import which
 from conans.client.tools.oss import OSInfo
-from conans.client.tools.system_pm import ChocolateyTool, SystemPackageTool, AptTool
+from conans.client.tools.system_pm import AptTool, BrewTool, ChocolateyTool, SystemPackageTool, \
+    YumTool
 from conans.errors import ConanException
 from conans.test.unittests.util.tools_test import RunnerMock
 from conans.test.utils.conanfile import MockSettings, MockConanfile
@@ -354,33 +355,96 @@ class SystemPackageToolTest(unittest.TestCase):
 
     def system_package_tool_try_multiple_test(self):
         class RunnerMultipleMock(object):
-            def __init__(self, expected=None):
+            def __init__(self, expected=None, query_output=""):
                 self.calls = 0
                 self.expected = expected
+                self.query_output = query_output
 
             def __call__(self, command, output):  # @UnusedVariable
                 self.calls += 1
+                if command.startswith("dpkg-query") and hasattr(output, "write"):
+                    output.write(self.query_output)
                 return 0 if command in self.expected else 1
 
         packages = ["a_package", "another_package", "yet_another_package"]
         with tools.environment_append({"CONAN_SYSREQUIRES_SUDO": "True"}):
-            runner = RunnerMultipleMock(['dpkg-query -W -f=\'${Status}\' another_package | '
-                                         'grep -q "ok installed"'])
+            # All the packages are checked with a single query
+            runner = RunnerMultipleMock([], query_output="another_package install ok installed\n"
+                                                         "dpkg-query: no packages found matching "
+                                                         "a_package\n")
             spt = SystemPackageTool(runner=runner, tool=AptTool(output=self.out), output=self.out)
             spt.install(packages)
-            self.assertEqual(2, runner.calls)
+            self.assertEqual(1, runner.calls)
+            self.assertIn("Package already installed: another_package", self.out)
             runner = RunnerMultipleMock(["sudo -A apt-get update",
                                          "sudo -A apt-get install -y --no-install-recommends"
                                          " yet_another_package"])
             spt = SystemPackageTool(runner=runner, tool=AptTool(output=self.out), output=self.out)
             spt.install(packages)
-            self.assertEqual(7, runner.calls)
+            self.assertEqual(5, runner.calls)
 
             runner = RunnerMultipleMock(["sudo -A apt-get update"])
             spt = SystemPackageTool(runner=runner, tool=AptTool(output=self.out), output=self.out)
             with self.assertRaises(ConanException):
                 spt.install(packages)
-            self.assertEqual(7, runner.calls)
+            self.assertEqual(5, runner.calls)
+
+    def installed_bulk_test(self):
+        class RunnerOutputMock(object):
+            def __init__(self, text, exit_code=0):
+                self.text = text
+                self.exit_code = exit_code
+                self.command_called = None
+
+            def __call__(self, command, output):
+                self.command_called = command
+                output.write(self.text)
+                return self.exit_code
+
+        class AptRunnerMock(object):
+            def __init__(self, query_text):
+                self.outputs = {"dpkg --print-architecture": "amd64\n"}
+                self.query_text = query_text
+                self.commands = []
+
+            def __call__(self, command, output):
+                self.commands.append(command)
+                output.write(self.outputs.get(command, self.query_text))
+                return 0
+
+        tool = AptTool(output=self.out)
+        tool._runner = AptRunnerMock("pkg1 install ok installed\n"
+                                     "pkg2:i386 deinstall ok config-files\n"
+                                     "pkg3:amd64 install ok installed\n"
+                                     "pkg5 install ok installed\n"
+                                     "pkg6 install ok installed\n"
+                                     "dpkg-query: no packages found matching pkg4\n")
+        # A native package is reported without ':arch', it doesn't make a foreign one installed
+        self.assertEqual({"pkg1", "pkg3:amd64", "pkg5:amd64"},
+                         tool.installed_bulk(["pkg1", "pkg2:i386", "pkg3:amd64", "pkg4",
+                                              "pkg5:amd64", "pkg6:armhf"]))
+        self.assertEqual(["dpkg-query -W -f='${binary:Package} ${Status}\\n' "
+                          "pkg1 pkg2:i386 pkg3:amd64 pkg4 pkg5:amd64 pkg6:armhf",
+                          "dpkg --print-architecture"], tool._runner.commands)
+
+        # Without any ':arch' there is no need to query the native architecture
+        tool._runner = AptRunnerMock("pkg1 install ok installed\n")
+        self.assertEqual({"pkg1"}, tool.installed_bulk(["pkg1", "pkg2"]))
+        self.assertEqual(1, len(tool._runner.commands))
+
+        tool = YumTool(output=self.out)
+        tool._runner = RunnerOutputMock("pkg1-1.0-1.el7.x86_64\n"
+                                        "package pkg2 is not installed\n", exit_code=1)
+        self.assertEqual({"pkg1"}, tool.installed_bulk(["pkg1", "pkg2"]))
+        self.assertEqual("rpm -q pkg1 pkg2", tool._runner.command_called)
+        # rpm failed for another reason
+        tool._runner = RunnerOutputMock("rpm: command not found\n", exit_code=127)
+        self.assertEqual(set(), tool.installed_bulk(["pkg1", "pkg2"]))
+
+        tool = BrewTool(output=self.out)
+        tool._runner = RunnerOutputMock("pkg1 1.0 1.1\n")
+        self.assertEqual({"pkg1"}, tool.installed_bulk(["pkg1", "pkg2"]))
+        self.assertEqual("brew ls --versions pkg1 pkg2", tool._runner.command_called)
 
     def system_package_tool_mode_test(self):
         """
@@ -426,7 +490,7 @@ class SystemPackageToolTest(unittest.TestCase):
                 spt.install(packages)
             self.assertIn("Aborted due to CONAN_SYSREQUIRES_MODE=", str(exc.exception))
             self.assertIn('\n'.join(packages), self.out)
-            self.assertEqual(3, runner.calls)
+            self.assertEqual(1, runner.calls)
 
         # Check disabled mode, a package report should be displayed in output.
         # No system packages are installed
@@ -452,7 +516,7 @@ class SystemPackageToolTest(unittest.TestCase):
             with self.assertRaises(ConanException) as exc:
                 spt.install(packages)
             self.assertNotIn("CONAN_SYSREQUIRES_MODE", str(exc.exception))
-            self.assertEqual(7, runner.calls)
+            self.assertEqual(5, runner.calls)
 
         # Check default_mode. The environment variable is not set and should behave like
         # the default_mode
@@ -468,7 +532,7 @@ class SystemPackageToolTest(unittest.TestCase):
                 spt.install(packages)
             self.assertIn("Aborted due to CONAN_SYSREQUIRES_MODE=", str(exc.exception))
             self.assertIn('\n'.join(packages), self.out)
-            self.assertEqual(3, runner.calls)
+            self.assertEqual(1, runner.calls)
 
     def system_package_tool_installed_test(self):
         if (platform.system() != "Linux" and platform.system() != "Macos" and
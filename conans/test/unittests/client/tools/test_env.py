@@ -1,7 +1,9 @@
 # coding=utf-8
 
 import os
+import sys
 import unittest
+from collections import namedtuple
 import mock
 
 from conans.client.tools import env
@@ -52,3 +54,20 @@ class ToolsEnvTest(unittest.TestCase):
                              {'env_var2': 'value2'}),\
              env.environment_append({'env_var1': None}):
                 self.assertNotIn('env_var1', os.environ)
+
+    def test_environment_append_restore(self):
+        with mock.patch.dict('os.environ', {'env_var1': 'value', 'env_var2': 'value2'}):
+            with env.environment_append({'env_var1': None, 'env_var2': ['new'],
+                                         'env_var3': 'value3'}):
+                self.assertNotIn('env_var1', os.environ)
+                self.assertEqual(os.environ['env_var2'], 'new' + os.pathsep + 'value2')
+            self.assertEqual(os.environ['env_var1'], 'value')
+            self.assertEqual(os.environ['env_var2'], 'value2')
+            self.assertNotIn('env_var3', os.environ)
+
+    def test_pythonpath(self):
+        conanfile = namedtuple("_ConanFile", ["env"])({"PYTHONPATH": ["path1", "path2"]})
+        old_path = list(sys.path)
+        with env.pythonpath(conanfile):
+            self.assertEqual(sys.path, old_path + ["path1", "path2"])
+        self.assertEqual(sys.path, old_path)
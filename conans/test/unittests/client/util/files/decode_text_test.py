@@ -4,7 +4,7 @@ import unittest
 
 from parameterized import parameterized
 
-from conans.util.files import decode_text
+from conans.util.files import _detect_encoding, decode_text
 
 
 class DecodeTextTest(unittest.TestCase):
@@ -31,3 +31,10 @@ class DecodeTextTest(unittest.TestCase):
                            (b'\x41', "utf_7")])
     def test_explicit_encodings(self, text, encoding):
         self.assertEqual('A', decode_text(text, encoding))
+
+    @parameterized.expand([(b'int main() {}\n', "utf-8"),
+                           (b'\xc3\xa1\n', "utf-8"),
+                           (b'\xe1\n', "Windows-1252"),
+                           (b'\x2b\x2f\x76\x38\x41', "utf_7")])
+    def test_detect_encoding(self, text, encoding):
+        self.assertEqual(encoding, _detect_encoding(text)[0])
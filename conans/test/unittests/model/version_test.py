@@ -55,6 +55,15 @@ class VersionTest(unittest.TestCase):
         self.assertFalse(Version("4.0.0.1") == "4")
         self.assertTrue(Version("4.0.0.1") >= "4")
 
+    def cached_major_minor_test(self):
+        v1 = Version("1.2.3")
+        self.assertIs(v1.major(), v1.major())
+        self.assertIs(v1.minor(), v1.minor())
+        self.assertEqual(v1.major(fill=False), "1")
+        self.assertEqual(v1.minor(fill=False), "1.2")
+        self.assertEqual(v1.major(), "1.Y.Z")
+        self.assertEqual(v1.minor(), "1.2.Z")
+
     def test_build_metadata_is_not_equal(self):
         # https://github.com/conan-io/conan/issues/5900
         self.assertNotEqual(Version("4.0.0+abc"), Version("4.0.0+xyz"))
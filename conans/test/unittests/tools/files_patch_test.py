@@ -1,3 +1,4 @@
+import logging
 import os
 import unittest
 from textwrap import dedent
@@ -6,6 +7,7 @@ from parameterized.parameterized import parameterized
 
 from conans.client.graph.python_requires import ConanPythonRequire
 from conans.client.loader import ConanFileLoader
+from conans.client.tools.files import patch
 from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestClient, TestBufferConanOutput, test_profile
 from conans.util.files import save, load
@@ -314,3 +316,29 @@ Z""")
         client.run("build .")
         content = client.load("Jamroot")
         self.assertIn(expected, content)
+
+    def test_patch_log_debug_skipped(self):
+        tmp = temp_folder()
+        save(os.path.join(tmp, "file.txt"), "one\ntwo\nx\n")
+        # The last context line doesn't match, patch_ng warns about it while applying with fuzz
+        patch_string = dedent("""\
+            --- a/file.txt
+            +++ b/file.txt
+            @@ -1,3 +1,3 @@
+             one
+            -two
+            +three
+             y
+            """)
+        patchlog = logging.getLogger("patch_ng")
+        old_level = patchlog.level
+        patchlog.setLevel(logging.DEBUG)
+        try:
+            output = TestBufferConanOutput()
+            patch(base_path=tmp, patch_string=patch_string, output=output, fuzz=True)
+        finally:
+            patchlog.setLevel(old_level)
+        self.assertEqual(load(os.path.join(tmp, "file.txt")), "one\nthree\nx\n")
+        self.assertNotIn("total files", output)
+        self.assertIn("WARN: patch_ng:  hunk no.1 doesn't match source file at line 3", output)
+        self.assertIn("patch_ng: successfully patched 1/1", output)
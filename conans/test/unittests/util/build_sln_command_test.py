@@ -179,6 +179,17 @@ class BuildSLNCommandTest(unittest.TestCase):
         self.assertNotIn('/m:%s' % cpu_count(output=output), command)
         self.assertNotIn('/target:teapot', command)
 
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            command = build_sln_command(Settings({}), sln_path='dummy.sln', targets=None,
+                                        upgrade_project=False, build_type='Debug', arch='armv7',
+                                        parallel=True, output=output)
+            self.assertIn('/m:%s' % cpu_count(output=output), command)
+            command = build_sln_command(Settings({}), sln_path='dummy.sln', targets=None,
+                                        upgrade_project=False, build_type='Debug', arch='armv7',
+                                        parallel=3, output=output)
+            self.assertIn('/m:3 ', command)
+
     def target_test(self):
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
@@ -1,9 +1,12 @@
 import os
 import unittest
 
+import mock
 import six
 
-from conans.client.tools.files import check_md5, check_sha1, check_sha256
+from conans.client.tools.env import environment_append
+from conans.client.tools.files import check_md5, check_sha1, check_sha256, \
+    check_with_algorithm_sums
 from conans.errors import ConanException
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import save
@@ -29,3 +32,41 @@ class HashesTest(unittest.TestCase):
 
         with six.assertRaisesRegex(self, ConanException, "sha256 signature failed for 'file.txt' file."):
             check_sha256(filepath, "invalid")
+
+    def chunked_hash_test(self):
+        folder = temp_folder()
+        filepath = os.path.join(folder, "file.txt")
+        save(filepath, "a file")
+
+        # Force the chunked path (no memory map) with tiny chunks
+        with mock.patch("conans.util.files._HASH_MMAP_MAX_SIZE", 0), \
+                mock.patch("conans.util.files._HASH_CHUNK_SIZE", 4):
+            check_md5(filepath, "d6d0c756fb8abfb33e652a20e85b70bc")
+            check_sha256(filepath,
+                         "7365d029861e32c521f8089b00a6fb32daf0615025b69b599d1ce53501b845c2")
+
+    def empty_file_hash_test(self):
+        folder = temp_folder()
+        filepath = os.path.join(folder, "empty.txt")
+        save(filepath, "")
+        check_md5(filepath, "d41d8cd98f00b204e9800998ecf8427e")
+
+    def multiple_files_test(self):
+        folder = temp_folder()
+        file1 = os.path.join(folder, "file.txt")
+        file2 = os.path.join(folder, "other.txt")
+        save(file1, "a file")
+        save(file2, "")
+
+        check_with_algorithm_sums("md5", [(file1, "d6d0c756fb8abfb33e652a20e85b70bc"),
+                                          (file2, "D41D8CD98F00B204E9800998ECF8427E")])
+        check_with_algorithm_sums("md5", [])
+
+        with six.assertRaisesRegex(self, ConanException,
+                                   "md5 signature failed for 'other.txt' file."):
+            check_with_algorithm_sums("md5", [(file1, "d6d0c756fb8abfb33e652a20e85b70bc"),
+                                              (file2, "invalid")])
+
+        # A CONAN_CPU_COUNT of 0 still checks the files with one worker
+        with environment_append({"CONAN_CPU_COUNT": "0"}):
+            check_with_algorithm_sums("md5", [(file1, "d6d0c756fb8abfb33e652a20e85b70bc")])
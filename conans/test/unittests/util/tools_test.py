@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
+import codecs
 import os
 import platform
 import subprocess
 import sys
+import tarfile
 import unittest
 import warnings
 from collections import namedtuple
@@ -23,7 +25,8 @@ from conans.client.output import ConanOutput
 from conans.client.tools.files import replace_in_file, which
 from conans.client.tools.oss import OSInfo
 from conans.client.tools.win import vswhere
-from conans.errors import ConanException, NotFoundException, AuthenticationException
+from conans.errors import ConanException, NotFoundException, AuthenticationException, \
+    ForbiddenException
 from conans.model.build_info import CppInfo
 from conans.model.settings import Settings
 from conans.test.utils.conanfile import ConanFileMock
@@ -31,7 +34,7 @@ from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import StoppableThreadBottle, TestBufferConanOutput, TestClient
 from conans.tools import get_global_instances
 from conans.util.env_reader import get_env
-from conans.util.files import load, md5, mkdir, save
+from conans.util.files import load, md5, mkdir, save, save_files
 from conans.util.runners import check_output_runner
 
 
@@ -83,6 +86,34 @@ class ReplaceInFileTest(unittest.TestCase):
         self.assertNotIn("nis", content)
         self.assertIn("nus", content)
 
+    def test_replace_in_file_utf8(self):
+        output = ConanOutput(sys.stdout)
+        utf8_file = os.path.join(self.tmp_folder, "utf8_encoding.txt")
+        save(utf8_file, u"J\xe2nis\xa7 J\xe2nis")
+        replace_in_file(utf8_file, u"J\xe2nis", u"J\xe2n\xefs", output=output)
+        self.assertEqual(load(utf8_file, binary=True),
+                         u"J\xe2n\xefs\xa7 J\xe2n\xefs".encode("utf-8"))
+
+        # The BOM is dropped, as the file is always written back as plain UTF-8
+        bom_file = os.path.join(self.tmp_folder, "bom_encoding.txt")
+        with open(bom_file, "wb") as handler:
+            handler.write(codecs.BOM_UTF8 + u"J\xe2nis".encode("utf-8"))
+        replace_in_file(bom_file, "nis", "nus", output=output)
+        self.assertEqual(load(bom_file, binary=True), u"J\xe2nus".encode("utf-8"))
+
+        # Invalid UTF-8 content for an explicit encoding fails, as when decoding it
+        invalid_file = os.path.join(self.tmp_folder, "invalid_encoding.txt")
+        save(invalid_file, b"J\xff nis")
+        with self.assertRaises(UnicodeDecodeError):
+            replace_in_file(invalid_file, "nis", "nus", output=output, encoding="utf-8")
+        self.assertEqual(load(invalid_file, binary=True), b"J\xff nis")
+
+        # An empty search inserts the replacement between characters, not bytes
+        empty_file = os.path.join(self.tmp_folder, "empty_search.txt")
+        save(empty_file, u"\xe2b")
+        replace_in_file(empty_file, "", "-", output=output)
+        self.assertEqual(load(empty_file, binary=True), u"-\xe2-b-".encode("utf-8"))
+
 
 class ToolsTest(unittest.TestCase):
     output = TestBufferConanOutput()
@@ -162,6 +193,23 @@ class ToolsTest(unittest.TestCase):
         cpus = tools.cpu_count(output=output)
         self.assertEqual(12, cpus)
 
+    @unittest.skipUnless(hasattr(os, "sched_getaffinity"), "Requires sched_getaffinity")
+    @patch("conans.client.tools.oss.CpuProperties.get_cpu_quota", side_effect=IOError)
+    def test_cpu_count_affinity(self, _):
+        with patch("os.sched_getaffinity", return_value={0, 2, 5}):
+            output = ConanOutput(sys.stdout)
+            self.assertEqual(3, tools.cpu_count(output=output))
+
+    def test_human_size(self):
+        self.assertEqual("0B", tools.human_size(0))
+        self.assertEqual("999B", tools.human_size(999))
+        self.assertEqual("1.0KB", tools.human_size(1000))
+        self.assertEqual("443.3KB", tools.human_size(443300))
+        self.assertEqual("4.3MB", tools.human_size(4300000))
+        self.assertEqual("4.43GB", tools.human_size(4430000000))
+        self.assertEqual("5.0TB", tools.human_size(5 * 10 ** 12))
+        self.assertEqual("5000.0PB", tools.human_size(5 * 10 ** 18))
+
     def get_env_unit_test(self):
         """
         Unit tests tools.get_env
@@ -791,6 +839,123 @@ class HelloConan(ConanFile):
             self.assertEqual(3, requester.count)
             self.assertIn("All downloads from (3) URLs have failed.", str(error.exception))
 
+    def test_get_tar_streamed(self):
+        """ tarballs without checksum are extracted from the download stream, no file is saved
+        """
+        tmp = temp_folder()
+        save_files(tmp, {"src/file.h": "header", "src/file.cpp": "source"})
+        tar_path = os.path.join(tmp, "sample.tar.gz")
+        with tarfile.open(tar_path, "w:gz") as tar:
+            tar.add(os.path.join(tmp, "src"), "src")
+        tar_content = load(tar_path, binary=True)
+
+        class MockRequester(object):
+            def get(self, *args, **kwargs):
+                self.kwargs = kwargs
+                resp = Response()
+                resp.raw = six.BytesIO(tar_content)
+                resp.status_code = 200
+                return resp
+
+        requester = MockRequester()
+        out = TestBufferConanOutput()
+        with tools.chdir(tools.mkdir_tmp()):
+            tools.get("http://fake_url/sample.tar.gz", requester=requester, output=out,
+                      pattern="*.h", destination="dest", retry=0, retry_wait=0)
+            self.assertTrue(requester.kwargs["stream"])
+            self.assertEqual("header", load("dest/src/file.h"))
+            self.assertFalse(os.path.exists("dest/src/file.cpp"))
+            self.assertFalse(os.path.exists("sample.tar.gz"))
+
+    def test_get_tar_streamed_interrupted(self):
+        """ a stream that ends before the Content-Length is retried, even at a member boundary
+        """
+        tmp = temp_folder()
+        save_files(tmp, {"a.txt": "a", "b.txt": "b"})
+        tar_path = os.path.join(tmp, "sample.tar")
+        with tarfile.open(tar_path, "w") as tar:
+            tar.add(os.path.join(tmp, "a.txt"), "a.txt")
+            tar.add(os.path.join(tmp, "b.txt"), "b.txt")
+        tar_content = load(tar_path, binary=True)
+
+        class MockRequester(object):
+            def __init__(self, sizes):
+                self.sizes = sizes
+                self.calls = 0
+
+            def get(self, *args, **kwargs):
+                resp = Response()
+                resp.raw = six.BytesIO(tar_content[:self.sizes[self.calls]])
+                resp.headers["Content-Length"] = str(len(tar_content))
+                resp.status_code = 200
+                self.calls += 1
+                return resp
+
+        out = TestBufferConanOutput()
+        # Header and data of a.txt, the stream ends exactly before the b.txt header
+        for size in (1024, 1500):
+            requester = MockRequester([size])
+            with tools.chdir(tools.mkdir_tmp()):
+                with six.assertRaisesRegex(self, ConanException, "Transfer interrupted"):
+                    tools.get("http://fake_url/sample.tar", requester=requester, output=out,
+                              destination="dest", retry=0, retry_wait=0)
+
+        requester = MockRequester([1024, len(tar_content)])
+        with tools.chdir(tools.mkdir_tmp()):
+            tools.get("http://fake_url/sample.tar", requester=requester, output=out,
+                      destination="dest", retry=1, retry_wait=0)
+            self.assertEqual(2, requester.calls)
+            self.assertEqual("a", load("dest/a.txt"))
+            self.assertEqual("b", load("dest/b.txt"))
+
+    def test_get_tar_streamed_forbidden(self):
+        class MockRequester(object):
+            calls = 0
+
+            def get(self, *args, **kwargs):
+                self.calls += 1
+                resp = Response()
+                resp.raw = six.BytesIO(b"")
+                resp.status_code = 403
+                return resp
+
+        requester = MockRequester()
+        out = TestBufferConanOutput()
+        with tools.chdir(tools.mkdir_tmp()):
+            with self.assertRaises(ForbiddenException):
+                tools.get("http://fake_url/sample.tar.gz", requester=requester, output=out,
+                          auth=("user", "password"), retry=2, retry_wait=0)
+        # Not retried
+        self.assertEqual(1, requester.calls)
+
+    @unittest.skipUnless(platform.system() == "Linux", "Requires Linux")
+    def test_get_tar_streamed_link_fallback(self):
+        """ hard links that cannot be created need the downloaded file to be extracted
+        """
+        tmp = temp_folder()
+        save_files(tmp, {"src/file.h": "header"})
+        os.link(os.path.join(tmp, "src", "file.h"), os.path.join(tmp, "src", "link.h"))
+        tar_path = os.path.join(tmp, "sample.tar.gz")
+        with tarfile.open(tar_path, "w:gz") as tar:
+            tar.add(os.path.join(tmp, "src"), "src")
+        tar_content = load(tar_path, binary=True)
+
+        class MockRequester(object):
+            def get(self, *args, **kwargs):
+                resp = Response()
+                resp.raw = six.BytesIO(tar_content)
+                resp.status_code = 200
+                return resp
+
+        out = TestBufferConanOutput()
+        with tools.chdir(tools.mkdir_tmp()):
+            with patch("os.link", side_effect=OSError):
+                tools.get("http://fake_url/sample.tar.gz", requester=MockRequester(), output=out,
+                          destination="dest", retry=0, retry_wait=0)
+            self.assertEqual("header", load("dest/src/file.h"))
+            self.assertEqual("header", load("dest/src/link.h"))
+            self.assertFalse(os.path.exists("sample.tar.gz"))
+
     def check_output_runner_test(self):
         import tempfile
         original_temp = tempfile.gettempdir()
@@ -5,6 +5,8 @@ import os
 import platform
 import unittest
 
+import mock
+
 from conans.client import tools
 from conans.client.tools.win import get_cased_path
 from conans.test.utils.test_files import temp_folder
@@ -49,6 +51,11 @@ class UnixPathTest(unittest.TestCase):
         path = 'C:\\Windows\\System32'
         self.assertEqual(path, tools.unix_path(path))
 
+    def test_msys_shell_path(self):
+        with mock.patch("platform.system", return_value="MSYS_NT-10.0"):
+            self.assertEqual('/c/windows/system32', tools.unix_path('C:\\Windows\\System32',
+                                                                    path_flavor=tools.MSYS2))
+
     @unittest.skipUnless(platform.system() == "Windows", "Only windows")
     def test_msys_path(self):
         self.assertEqual('/c/windows/system32', tools.unix_path('C:\\Windows\\System32',
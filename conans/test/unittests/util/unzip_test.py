@@ -0,0 +1,109 @@
+import os
+import platform
+import stat
+import tarfile
+import unittest
+import zipfile
+
+import mock
+from six import StringIO
+
+from conans.client.output import ConanOutput
+from conans.client.tools.files import unzip
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save
+
+
+class UnzipTest(unittest.TestCase):
+
+    def test_unzip_members(self):
+        tmp_dir = temp_folder()
+        zip_path = os.path.join(tmp_dir, "example.zip")
+        big_content = "0123456789" * 50000
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as z:
+            z.writestr("root.txt", "root")
+            z.writestr("folder/", "")
+            z.writestr("folder/sub/file.txt", "file")
+            z.writestr("folder/sub/big.txt", big_content)
+            z.writestr("../outside.txt", "outside")
+            z.writestr("empty/", "")
+
+        dest_dir = os.path.join(temp_folder(), "dest")
+        unzip(zip_path, dest_dir, output=ConanOutput(StringIO()))
+
+        self.assertEqual(load(os.path.join(dest_dir, "root.txt")), "root")
+        self.assertEqual(load(os.path.join(dest_dir, "folder", "sub", "file.txt")), "file")
+        self.assertEqual(load(os.path.join(dest_dir, "folder", "sub", "big.txt")), big_content)
+        # Parent references are removed, as ZipFile.extract() does
+        self.assertEqual(load(os.path.join(dest_dir, "outside.txt")), "outside")
+        self.assertFalse(os.path.exists(os.path.join(os.path.dirname(dest_dir), "outside.txt")))
+        self.assertTrue(os.path.isdir(os.path.join(dest_dir, "empty")))
+
+    @unittest.skipUnless(platform.system() == "Linux", "Requires Linux")
+    def test_unzip_keep_permissions(self):
+        tmp_dir = temp_folder()
+        zip_path = os.path.join(tmp_dir, "example.zip")
+        with zipfile.ZipFile(zip_path, "w") as z:
+            info = zipfile.ZipInfo("../script.sh")
+            info.external_attr = 0o755 << 16
+            z.writestr(info, "echo hello")
+
+        dest_dir = os.path.join(temp_folder(), "dest")
+        output = ConanOutput(StringIO())
+        unzip(zip_path, dest_dir, keep_permissions=True, output=output)
+        # The permissions are applied to the sanitized path where the member was extracted
+        script = os.path.join(dest_dir, "script.sh")
+        self.assertEqual(load(script), "echo hello")
+        self.assertEqual(os.stat(script).st_mode & 0o777, 0o755)
+        self.assertNotIn("ERROR", output._stream.getvalue())
+
+    def _create_tgz(self):
+        tmp_dir = temp_folder()
+        save(os.path.join(tmp_dir, "src", "readonly", "file.txt"), "file")
+        save(os.path.join(tmp_dir, "src", "readonly.txt"), "readonly")
+        os.chmod(os.path.join(tmp_dir, "src", "readonly.txt"), 0o444)
+        save(os.path.join(tmp_dir, "src", "other.txt"), "other")
+        os.link(os.path.join(tmp_dir, "src", "other.txt"), os.path.join(tmp_dir, "src", "hard.txt"))
+        tgz_path = os.path.join(tmp_dir, "example.tgz")
+        with tarfile.open(tgz_path, "w:gz") as tgz:
+            os.chmod(os.path.join(tmp_dir, "src", "readonly"), 0o555)
+            for name in ("readonly", "readonly/file.txt", "readonly.txt", "other.txt",
+                         "hard.txt"):
+                tgz.add(os.path.join(tmp_dir, "src", name), arcname=name, recursive=False)
+        return tgz_path
+
+    @unittest.skipUnless(platform.system() == "Linux", "Requires Linux")
+    def test_untargz(self):
+        tgz_path = self._create_tgz()
+        dest_dir = os.path.join(temp_folder(), "dest")
+        unzip(tgz_path, dest_dir, output=ConanOutput(StringIO()))
+        self.assertEqual(load(os.path.join(dest_dir, "readonly", "file.txt")), "file")
+        self.assertEqual(load(os.path.join(dest_dir, "hard.txt")), "other")
+        # Directories permissions are set after their contents are extracted
+        self.assertFalse(os.stat(os.path.join(dest_dir, "readonly")).st_mode & stat.S_IWUSR)
+
+        dest_dir = os.path.join(temp_folder(), "dest")
+        unzip(tgz_path, dest_dir, pattern="*.txt", output=ConanOutput(StringIO()))
+        self.assertEqual(sorted(os.listdir(dest_dir)),
+                         ["hard.txt", "other.txt", "readonly", "readonly.txt"])
+
+    @unittest.skipUnless(platform.system() == "Linux", "Requires Linux")
+    def test_untargz_link_fallback(self):
+        tgz_path = self._create_tgz()
+        dest_dir = os.path.join(temp_folder(), "dest")
+        written = []
+        makefile = tarfile.TarFile.makefile
+
+        def makefile_spy(tar, member, target_path):
+            makefile(tar, member, target_path)
+            written.append(os.path.relpath(target_path, dest_dir))
+
+        # Hard links that cannot be created need to read their target again from the archive
+        with mock.patch("os.link", side_effect=OSError):
+            with mock.patch.object(tarfile.TarFile, "makefile", makefile_spy):
+                unzip(tgz_path, dest_dir, output=ConanOutput(StringIO()))
+        self.assertEqual(load(os.path.join(dest_dir, "hard.txt")), "other")
+        self.assertEqual(load(os.path.join(dest_dir, "readonly.txt")), "readonly")
+        # The second pass resumes at the link, the read-only file is not written again
+        self.assertEqual(written, [os.path.join("readonly", "file.txt"), "readonly.txt",
+                                   "other.txt", "hard.txt"])
@@ -87,6 +87,7 @@ chdir = tools_files.chdir
 human_size = tools_files.human_size
 untargz = tools_files.untargz
 check_with_algorithm_sum = tools_files.check_with_algorithm_sum
+check_with_algorithm_sums = tools_files.check_with_algorithm_sums
 check_sha1 = tools_files.check_sha1
 check_md5 = tools_files.check_md5
 check_sha256 = tools_files.check_sha256
@@ -227,7 +228,7 @@ def latest_vs_version_installed(*args, **kwargs):
 
 # Ready to use objects.
 try:
-    os_info = OSInfo()
+    os_info = tools_oss.get_os_info()
 except Exception as exc:
     logger.error(exc)
     _global_output.error("Error detecting os_info")
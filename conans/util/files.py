@@ -1,5 +1,6 @@
 import errno
 import hashlib
+import mmap
 import os
 import platform
 import re
@@ -86,6 +87,11 @@ def _detect_encoding(text):
                 return encodings[bom], len(bom)
             except UnicodeDecodeError:
                 continue
+    # ASCII (most of the sources) is valid UTF-8, no need to decode the text to check it
+    # bytes.isascii() is new in Python 3.7
+    isascii = getattr(text, "isascii", None)
+    if isascii is not None and isascii():
+        return "utf-8", 0
     decoders = ["utf-8", "Windows-1252"]
     for decoder in decoders:
         try:
@@ -148,15 +154,32 @@ def sha256sum(file_path):
     return _generic_algorithm_sum(file_path, "sha256")
 
 
+# Files up to this size are hashed from a single memory map, bigger ones are read in chunks
+_HASH_MMAP_MAX_SIZE = 256 * 1024 * 1024
+_HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+
 def _generic_algorithm_sum(file_path, algorithm_name):
 
     with open(file_path, 'rb') as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if 0 < size <= _HASH_MMAP_MAX_SIZE:
+            # Feeding a single contiguous buffer lets hashlib (OpenSSL) use the fastest
+            # implementation available, without per-chunk Python overhead
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return hashlib.new(algorithm_name, mm).hexdigest()
+            finally:
+                mm.close()
+
         m = hashlib.new(algorithm_name)
+        buf = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buf)
         while True:
-            data = fh.read(8192)
-            if not data:
+            n = fh.readinto(buf)
+            if not n:
                 break
-            m.update(data)
+            m.update(view[:n])
         return m.hexdigest()
 
 